@@ -0,0 +1,4 @@
+# lightweight dashboard entry - renders from the snapshot written by `blob-snapshot`
+from eip4844_blob_data.app import create_dashboard
+
+create_dashboard().servable()
@@ -0,0 +1,44 @@
+import os
+from typing import Optional
+
+from eip4844_blob_data.panel_charts import start_interactive_panel
+from eip4844_blob_data.snapshot import load_snapshot
+
+# directory `blob-snapshot` writes to, can be overridden for deployments
+SNAPSHOT_DIR_ENV: str = "BLOB_SNAPSHOT_DIR"
+
+
+def create_dashboard(snapshot_root: Optional[str] = None):
+    """
+    Builds the dashboard from the latest precomputed snapshot, without querying or preprocessing any data.
+    """
+    import panel as pn
+
+    if snapshot_root is None:
+        snapshot_root = os.environ.get(SNAPSHOT_DIR_ENV, "snapshots")
+
+    pn.extension("tabulator", template="material",
+                 sizing_mode="stretch_width")
+
+    try:
+        frames, manifest = load_snapshot(snapshot_root)
+    except FileNotFoundError:
+        return pn.pane.Alert(
+            f"No dashboard snapshot found in `{snapshot_root}`. "
+            f"Run `blob-snapshot --output-dir {snapshot_root}` to create one.",
+            alert_type="warning",
+        )
+    except ValueError as e:
+        # schema version mismatch, e.g. after a deploy and before `blob-snapshot` has rerun
+        return pn.pane.Alert(str(e), alert_type="warning")
+
+    return start_interactive_panel(
+        {
+            "slot_inclusion_df": frames["slot_inclusion_df"],
+            "slot_gas_groupby_df": frames["slot_gas_groupby_df"],
+        },
+        manifest["sequencer_names"],
+        block_agg_df=frames["block_agg_df"],
+        sequencer_macro_blob_table=frames["sequencer_macro_blob_table"],
+        num_days=manifest["num_days"],
+    )
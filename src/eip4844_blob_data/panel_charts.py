@@ -1,11 +1,25 @@
-import holoviews as hv
 import polars as pl
-import panel as pn
-from eip4844_blob_data.polars_preprocess import create_blob_block_df, create_block_agg_df
+from eip4844_blob_data.polars_preprocess import (
+    create_blob_block_df,
+    create_block_agg_df,
+    create_sequencer_macro_blob_table,
+)
+
+# `panel`, `holoviews` and `hvplot` are heavy to import, so they are only pulled in
+# when a chart or widget is actually built (polars' `.plot` loads hvplot on first use).
 
 
 # start dashboard
-def start_interactive_panel(filtered_data_dict, sequencer_names_list):
+def start_interactive_panel(filtered_data_dict, sequencer_names_list, block_agg_df=None, sequencer_macro_blob_table=None, num_days=7):
+    """
+    Build the dashboard layout. `block_agg_df` and `sequencer_macro_blob_table` are derived from
+    `filtered_data_dict["slot_inclusion_df"]` when they are not passed in (e.g. from a snapshot).
+    `num_days` is the period the data covers and is only used for headings.
+    """
+    import panel as pn
+
+    period_label = "weekly" if num_days == 7 else f"{num_days} days"
+
     multi_select = pn.widgets.MultiSelect(
         name="Sequencers",
         size=10,
@@ -35,10 +49,11 @@ def start_interactive_panel(filtered_data_dict, sequencer_names_list):
     )
 
     # NEW - 2 DF TRANSFORMATIONS + 2 CHARTS ADDED 6/10/24. TODO - REFACTOR OUT?
-    blob_block_df: pl.DataFrame = create_blob_block_df(
-        filtered_data_dict["slot_inclusion_df"]).sort(by='slot_time')
+    if block_agg_df is None:
+        blob_block_df: pl.DataFrame = create_blob_block_df(
+            filtered_data_dict["slot_inclusion_df"]).sort(by='slot_time')
 
-    block_agg_df = create_block_agg_df(blob_block_df).sort(by='slot_time')
+        block_agg_df = create_block_agg_df(blob_block_df).sort(by='slot_time')
 
     # stacked line chart
     fees_paid_line = block_agg_df.plot.line(
@@ -57,7 +72,7 @@ def start_interactive_panel(filtered_data_dict, sequencer_names_list):
         pl.col('base_fees_per_block_eth').cum_sum().alias('base fee'),
         pl.col('priority_fees_per_block_eth').cum_sum().alias('priority fee')
     ]).sort(by='block_number').plot.line(
-        x='slot_time', y=['base fee', 'priority fee'], xlabel='time', ylabel='fees (in ETH)', title='Cumulative Fees (weekly)').opts(yaxis='right')
+        x='slot_time', y=['base fee', 'priority fee'], xlabel='time', ylabel='fees (in ETH)', title=f'Cumulative Fees ({period_label})').opts(yaxis='right')
 
     # # fee sequencer area chart ! Not ready, there's bugs here.
     # fee_sequencer_pivot: pl.DataFrame = (
@@ -71,26 +86,9 @@ def start_interactive_panel(filtered_data_dict, sequencer_names_list):
     #     column for column in fee_sequencer_pivot.columns if column != "slot_time"
     # ], xlabel='time', ylabel='fees (in ETH)', title='Total Fees Paid (weekly)'))
 
-    sequencer_macro_blob_table: pl.DataFrame = (
-        filtered_data_dict['slot_inclusion_df'].drop_nulls().unique().group_by(
-            'sequencer_names').agg(
-            pl.col('fill_percentage').mean().alias('avg_fill_percentage'),
-            pl.col('submission_count').mean().alias(
-                'avg_submission_count'),
-            pl.col('slot_inclusion_rate').mean().round(
-                3).alias('avg_slot_inclusion_rate'),
-            pl.col('blob_hashes_length').mean().alias(
-                'avg_blob_hashes_length'),
-            pl.len().alias('tx_count'),
-            pl.col('blob_hashes_length').sum().alias('blob_count'),
-            pl.col('base_tx_fee_eth').sum().round(
-                3).alias('total_base_fees_eth'),
-            pl.col('priority_tx_fee_eth').sum().round(
-                3).alias('total_priority_fees_eth'),
-            pl.col('total_tx_fee_eth').sum().round(3).alias('total_eth_fees'),
-            pl.col('priority_fee_gas').mean().round(
-                3).alias('avg_priority_fee_bid'),
-        ).rename({'sequencer_names': 'rollup', 'avg_blob_hashes_length': 'avg_blobs_in_tx'}))
+    if sequencer_macro_blob_table is None:
+        sequencer_macro_blob_table = create_sequencer_macro_blob_table(
+            filtered_data_dict['slot_inclusion_df'])
 
     slot_inclusion_table_tabulator = get_slot_inclusion_table(
         filtered_data_dict["slot_inclusion_df"], sequencer_names_list)
@@ -103,15 +101,15 @@ def start_interactive_panel(filtered_data_dict, sequencer_names_list):
     entire_panel = pn.Column(
         pn.Row(
             pn.pane.Markdown(
-                """
-            # EIP-4844 Blob Inclusion Dashboard (7 days)
+                f"""
+            # EIP-4844 Blob Inclusion Dashboard ({num_days} days)
 
             ## About
             This dashboard shows detailed analytics for blob inclusion rates as well as the efficiency of using EIP-1559 priority fees
             as a bidding mechanism for faster slot inclusion. This dashboard is made using [Xatu Data](https://github.com/ethpandaops/xatu-data?tab=readme-ov-file) for EL mempool and Beacon chain data and [Hypersync](https://github.com/enviodev/hypersync-client-python)
             for transaction gas data for the [EIP-4844 data challenge](https://esp.ethereum.foundation/data-challenge-4844).
 
-            The dashboard currently shows the past 7 days worth of data. Data for a longer time frame is available on request. Just reach out to
+            The dashboard currently shows the past {num_days} days worth of data. Data for a longer time frame is available on request. Just reach out to
             @evandekim on telegram or twitter.
             """
             ),
@@ -120,8 +118,8 @@ def start_interactive_panel(filtered_data_dict, sequencer_names_list):
         ),
         pn.Row(
             pn.pane.Markdown(
-                """
-            ## 7 Day Historical Slot Inclusion
+                f"""
+            ## {num_days} Day Historical Slot Inclusion
             When a transaction is resubmitted with updated gas parameters, the transaction hash changes. For example take this blob reference hash - 0x01c738cf37c911334c771f2295c060e5bd7d084f347e4334863336724934c59a.
             On [etherscan](https://etherscan.io/tx/0x763d823c0f933c4d2eb84406b37aa2649753f2f563fa3ee6d27251c6a52a8d69) we can see that the transaction was replaced by the user. We can see on Ethernow that the transaction contains
             the same blob reference hash in both the [original tx](https://www.ethernow.xyz/tx/0x763d823c0f933c4d2eb84406b37aa2649753f2f563fa3ee6d27251c6a52a8d69?batchIndex=1) and the [resubmitted tx](https://www.ethernow.xyz/tx/0x5a4094662bd05ff3639a8979927ab527e007a6925387951a9c1b3d2958b13a86?batchIndex=1).
@@ -157,18 +155,18 @@ def start_interactive_panel(filtered_data_dict, sequencer_names_list):
 
         pn.Row(
             pn.pane.Markdown(
-                """
-                # Blob Transaction Data (Past 7 days)
+                f"""
+                # Blob Transaction Data (Past {num_days} days)
                 Blob transactions have three primary costs - the base block fee, the base blob fee, and the base. At the time of writing (June 2024),
                 since the blob base fee remains at 0, the dashboard focuses only on the base fee and priority fee components. The chart
                 ## **Fees Paid vs Slot Inclusion Rate** 
                 Shows the fluctuation of the base fees over time and how the slot inclusion rates are affected.
                 The average slot inclusion rate can be seen in the table below. 
                 ## **Base Fee vs Priority Fee (gwei)** 
-                Shows the total fees accured over a weekly timeframe broken down between the base fee and the priority fee. Once the blob base fee
+                Shows the total fees accured over the past {num_days} days broken down between the base fee and the priority fee. Once the blob base fee
                 becomes non-trivial, an additional line will be updated in the chart.
-                ## **Cumulative Fees (weekly)** 
-                Fee market chart - shows fees accumulated in the past 7 days. 
+                ## **Cumulative Fees ({period_label})** 
+                Fee market chart - shows fees accumulated in the past {num_days} days. 
                 """
             ),
             pn.Row(
@@ -349,6 +347,8 @@ def fee_breakdown_line(df: pl.DataFrame, sequencers: list[str]):
 
 
 def get_slot_inclusion_table(df: pl.DataFrame, sequencers: list[str]):
+    import panel as pn
+
     slot_df = (df.filter(pl.col("sequencer_names").is_in(sequencers)).drop_nulls().sort(
         by='slot_inclusion_rate', descending=True)
     )
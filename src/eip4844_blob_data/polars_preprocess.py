@@ -286,3 +286,51 @@ def create_block_agg_df(blob_block_df: pl.DataFrame) -> pl.DataFrame:
         pl.col('base_fee_per_gas').mean(),
         pl.col('blobs_per_block').sum().alias('blobs_per_block'),
     ).sort(by='block_number')
+
+
+def create_slot_inclusion_joined_df(cached_data: dict[str, pl.DataFrame], sequencers_l2: dict[str, list[str]]) -> pl.DataFrame:
+    """
+    Joins slot inclusion data with sequencer labels and gas bidding data. This is the base dataframe the dashboard is built on.
+    """
+    slot_inclusion_df = create_slot_inclusion_df(
+        cached_data).join(
+        pl.from_dict(sequencers_l2),
+        left_on="from",
+        right_on="sequencer_addresses",
+        how="left",
+        coalesce=True
+    ).select('slot', 'slot_time', 'hash', 'blob_hashes_length', 'fill_percentage', 'submission_count', 'slot_inclusion_rate', 'sequencer_names', 'meta_network_name')
+
+    slot_gas_bidding_df = create_slot_gas_bidding_df(
+        cached_data).select('block_number', 'extra_data', 'builder_label', 'hash', 'base_tx_fee_eth', 'priority_tx_fee_eth', "base_fee_per_gas",
+                            "priority_fee_gas", 'total_tx_fee_eth', 'priority_fee_bid_percent_premium')
+
+    return slot_inclusion_df.join(
+        slot_gas_bidding_df, on="hash", how="left", coalesce=True
+    )
+
+
+def create_sequencer_macro_blob_table(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Groupby on sequencer name to get average inclusion and total fee data per rollup.
+    """
+    return (
+        df.drop_nulls().unique().group_by(
+            'sequencer_names').agg(
+            pl.col('fill_percentage').mean().alias('avg_fill_percentage'),
+            pl.col('submission_count').mean().alias(
+                'avg_submission_count'),
+            pl.col('slot_inclusion_rate').mean().round(
+                3).alias('avg_slot_inclusion_rate'),
+            pl.col('blob_hashes_length').mean().alias(
+                'avg_blob_hashes_length'),
+            pl.len().alias('tx_count'),
+            pl.col('blob_hashes_length').sum().alias('blob_count'),
+            pl.col('base_tx_fee_eth').sum().round(
+                3).alias('total_base_fees_eth'),
+            pl.col('priority_tx_fee_eth').sum().round(
+                3).alias('total_priority_fees_eth'),
+            pl.col('total_tx_fee_eth').sum().round(3).alias('total_eth_fees'),
+            pl.col('priority_fee_gas').mean().round(
+                3).alias('avg_priority_fee_bid'),
+        ).rename({'sequencer_names': 'rollup', 'avg_blob_hashes_length': 'avg_blobs_in_tx'}))
@@ -0,0 +1,202 @@
+import argparse
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from typing import Optional
+
+import polars as pl
+from eip4844_blob_data.panel_charts import filter_data_seq
+from eip4844_blob_data.polars_preprocess import (
+    create_blob_block_df,
+    create_block_agg_df,
+    create_sequencer_macro_blob_table,
+    create_slot_inclusion_joined_df,
+)
+from eip4844_blob_data.sequencers import sequencers_l2
+
+# bump when the set of frames or their columns change so old snapshots are rejected
+SNAPSHOT_SCHEMA_VERSION: int = 1
+
+SNAPSHOT_FRAMES: list[str] = [
+    "slot_inclusion_df",
+    "slot_gas_groupby_df",
+    "block_agg_df",
+    "sequencer_macro_blob_table",
+]
+
+LATEST_POINTER: str = "LATEST"
+MANIFEST_FILE: str = "manifest.json"
+
+
+def create_snapshot_frames(cached_data: dict[str, pl.DataFrame], sequencers: dict[str, list[str]] = sequencers_l2) -> dict[str, pl.DataFrame]:
+    """
+    Runs the dashboard preprocessing and returns every frame the dashboard needs to render.
+    """
+    slot_inclusion_joined_df = create_slot_inclusion_joined_df(
+        cached_data, sequencers)
+
+    filtered_data_dict = filter_data_seq(
+        sequencers["sequencer_names"], slot_inclusion_joined_df, cached_data
+    )
+
+    blob_block_df: pl.DataFrame = create_blob_block_df(
+        filtered_data_dict["slot_inclusion_df"]).sort(by='slot_time')
+
+    return {
+        "slot_inclusion_df": filtered_data_dict["slot_inclusion_df"],
+        "slot_gas_groupby_df": filtered_data_dict["slot_gas_groupby_df"],
+        "block_agg_df": create_block_agg_df(blob_block_df).sort(by='slot_time'),
+        "sequencer_macro_blob_table": create_sequencer_macro_blob_table(filtered_data_dict["slot_inclusion_df"]),
+    }
+
+
+def write_snapshot(frames: dict[str, pl.DataFrame], output_dir: str, sequencer_names: list[str], num_days: int) -> str:
+    """
+    Writes `frames` to a new versioned directory under `output_dir` and points `LATEST` at it.
+
+    Frames are written to a temporary sibling directory that is moved into place once complete, and
+    the pointer is swapped atomically after that, so a dashboard reading the snapshot never sees a
+    partially written version.
+
+    Raises a `ValueError` without writing anything if `slot_inclusion_df` is empty, so a failed
+    refresh never replaces a good snapshot.
+
+    Returns the path of the new snapshot directory.
+    """
+    if frames["slot_inclusion_df"].is_empty():
+        raise ValueError(
+            "refusing to write a snapshot with an empty `slot_inclusion_df`")
+
+    created_at = datetime.now(timezone.utc)
+    # microseconds keep versions unique when runs overlap, and still sort chronologically
+    version = created_at.strftime("%Y%m%dT%H%M%S%fZ")
+    snapshot_dir = os.path.join(output_dir, version)
+    os.makedirs(output_dir, exist_ok=True)
+
+    tmp_dir = tempfile.mkdtemp(prefix=f".{version}-", dir=output_dir)
+    try:
+        for name in SNAPSHOT_FRAMES:
+            frames[name].write_parquet(
+                os.path.join(tmp_dir, f"{name}.parquet"))
+
+        manifest = {
+            "schema_version": SNAPSHOT_SCHEMA_VERSION,
+            "version": version,
+            "created_at": created_at.isoformat(),
+            "num_days": num_days,
+            "sequencer_names": sorted(sequencer_names),
+            "frames": {name: frames[name].height for name in SNAPSHOT_FRAMES},
+        }
+        with open(os.path.join(tmp_dir, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        if os.path.exists(snapshot_dir):
+            raise FileExistsError(f"snapshot {version} already exists")
+        os.replace(tmp_dir, snapshot_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    pointer_path = os.path.join(output_dir, LATEST_POINTER)
+    tmp_pointer_path = f"{pointer_path}.{version}.tmp"
+    with open(tmp_pointer_path, "w") as f:
+        f.write(version)
+    os.replace(tmp_pointer_path, pointer_path)
+
+    return snapshot_dir
+
+
+def prune_snapshots(output_dir: str, keep: int) -> list[str]:
+    """
+    Deletes all but the `keep` newest snapshot versions in `output_dir`. The version `LATEST` points at is never deleted.
+
+    Returns the deleted versions.
+    """
+    pointer_path = os.path.join(output_dir, LATEST_POINTER)
+    latest = None
+    if os.path.exists(pointer_path):
+        with open(pointer_path) as f:
+            latest = f.read().strip()
+
+    # version names are UTC timestamps, so sorting them by name sorts them by age
+    versions = sorted(
+        entry for entry in os.listdir(output_dir)
+        if not entry.startswith(".") and os.path.isfile(os.path.join(output_dir, entry, MANIFEST_FILE))
+    )
+    stale = [version for version in versions[:max(len(versions) - keep, 0)]
+             if version != latest]
+
+    for version in stale:
+        shutil.rmtree(os.path.join(output_dir, version))
+
+    return stale
+
+
+def load_snapshot(snapshot_root: str, version: Optional[str] = None) -> tuple[dict[str, pl.DataFrame], dict]:
+    """
+    Loads the snapshot frames and manifest for `version`, or the version `LATEST` points at.
+
+    Raises a `FileNotFoundError` if no snapshot has been written yet and a `ValueError` if the
+    snapshot was written with a different schema version.
+    """
+    if version is None:
+        with open(os.path.join(snapshot_root, LATEST_POINTER)) as f:
+            version = f.read().strip()
+
+    snapshot_dir = os.path.join(snapshot_root, version)
+    with open(os.path.join(snapshot_dir, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+
+    if manifest["schema_version"] != SNAPSHOT_SCHEMA_VERSION:
+        raise ValueError(
+            f"snapshot {version} has schema version {manifest['schema_version']}, expected {SNAPSHOT_SCHEMA_VERSION}. "
+            "Rerun `blob-snapshot` to refresh it."
+        )
+
+    frames = {
+        name: pl.read_parquet(os.path.join(snapshot_dir, f"{name}.parquet"))
+        for name in SNAPSHOT_FRAMES
+    }
+    return frames, manifest
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Console entry point - fetches and preprocesses dashboard data headlessly and writes a snapshot.
+    """
+    parser = argparse.ArgumentParser(
+        prog="blob-snapshot",
+        description="Precompute the blob dashboard data and write a versioned snapshot.",
+    )
+    parser.add_argument("--output-dir", default="snapshots",
+                        help="directory that versioned snapshots are written to (default: snapshots)")
+    parser.add_argument("--days", type=int, default=7,
+                        help="number of days of data to fetch (default: 7)")
+    parser.add_argument("--keep", type=int, default=3,
+                        help="number of snapshot versions to keep, older ones are deleted (default: 3)")
+    args = parser.parse_args(argv)
+    if args.keep < 1:
+        parser.error("--keep must be at least 1")
+
+    # the ethpandaops client is only needed to refresh data, not to serve the dashboard
+    from ethpandaops_python.preprocessor import Preprocessor
+
+    cached_data = Preprocessor(
+        blob_producer=sequencers_l2,
+        period=args.days,
+        # `sequencers_l2` and the dashboard preprocessing only cover mainnet
+        network="mainnet",
+    ).cached_data
+
+    frames = create_snapshot_frames(cached_data)
+    snapshot_dir = write_snapshot(
+        frames, args.output_dir, sequencers_l2["sequencer_names"], args.days)
+    prune_snapshots(args.output_dir, args.keep)
+
+    print(f"wrote snapshot to {snapshot_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from datetime import datetime
+
+import polars as pl
+
+from eip4844_blob_data import polars_preprocess
+from eip4844_blob_data.polars_preprocess import (
+    create_sequencer_macro_blob_table,
+    create_slot_inclusion_joined_df,
+)
+
+sequencers: dict[str, list[str]] = {
+    "sequencer_addresses": ["0xaaa", "0xbbb"],
+    "sequencer_names": ["arbitrum", "base"],
+}
+
+
+def test_create_sequencer_macro_blob_table():
+    df = pl.DataFrame({
+        "sequencer_names": ["arbitrum", "arbitrum", "base", "base"],
+        "fill_percentage": [50.0, 100.0, 25.0, None],
+        "submission_count": [1, 3, 2, 2],
+        "slot_inclusion_rate": [1.0, 2.0, 4.0, 4.0],
+        "blob_hashes_length": [1, 3, 6, 6],
+        "base_tx_fee_eth": [0.0011, 0.0022, 0.01, 0.01],
+        "priority_tx_fee_eth": [0.0001, 0.0002, 0.001, 0.001],
+        "total_tx_fee_eth": [0.0012, 0.0024, 0.011, 0.011],
+        "priority_fee_gas": [1.5, 2.5, 3.0, 3.0],
+    })
+
+    result = create_sequencer_macro_blob_table(df).sort(by="rollup")
+
+    # the `base` row with a null `fill_percentage` is dropped before aggregating
+    assert result.to_dicts() == [
+        {
+            "rollup": "arbitrum",
+            "avg_fill_percentage": 75.0,
+            "avg_submission_count": 2.0,
+            "avg_slot_inclusion_rate": 1.5,
+            "avg_blobs_in_tx": 2.0,
+            "tx_count": 2,
+            "blob_count": 4,
+            "total_base_fees_eth": 0.003,
+            "total_priority_fees_eth": 0.0,
+            "total_eth_fees": 0.004,
+            "avg_priority_fee_bid": 2.0,
+        },
+        {
+            "rollup": "base",
+            "avg_fill_percentage": 25.0,
+            "avg_submission_count": 2.0,
+            "avg_slot_inclusion_rate": 4.0,
+            "avg_blobs_in_tx": 6.0,
+            "tx_count": 1,
+            "blob_count": 6,
+            "total_base_fees_eth": 0.01,
+            "total_priority_fees_eth": 0.001,
+            "total_eth_fees": 0.011,
+            "avg_priority_fee_bid": 3.0,
+        },
+    ]
+
+
+def test_create_slot_inclusion_joined_df(monkeypatch):
+    slot_inclusion_df = pl.DataFrame({
+        "slot": [1, 2, 3],
+        "slot_time": [datetime(2024, 6, 1, 0, 0, 12 * i) for i in range(1, 4)],
+        "hash": ["0x01", "0x02", "0x03"],
+        "from": ["0xaaa", "0xbbb", "0xccc"],
+        "blob_hashes_length": [1, 2, 3],
+        "fill_percentage": [10.0, 20.0, 30.0],
+        "submission_count": [1, 1, 2],
+        "slot_inclusion_rate": [1.0, 2.0, 3.0],
+        "meta_network_name": ["mainnet"] * 3,
+        "blob_size": [100, 200, 300],
+    })
+    slot_gas_bidding_df = pl.DataFrame({
+        "block_number": [10, 11],
+        "extra_data": ["0x", "0x"],
+        "builder_label": ["rsync_builder", "vanilla_builder_geth"],
+        "hash": ["0x01", "0x02"],
+        "base_tx_fee_eth": [0.1, 0.2],
+        "priority_tx_fee_eth": [0.01, 0.02],
+        "base_fee_per_gas": [5.0, 6.0],
+        "priority_fee_gas": [1.0, 2.0],
+        "total_tx_fee_eth": [0.11, 0.22],
+        "priority_fee_bid_percent_premium": [0.2, 0.3],
+        "meta_network_name": ["mainnet"] * 2,
+    })
+    monkeypatch.setattr(polars_preprocess, "create_slot_inclusion_df",
+                        lambda cached_data: slot_inclusion_df)
+    monkeypatch.setattr(polars_preprocess, "create_slot_gas_bidding_df",
+                        lambda cached_data: slot_gas_bidding_df)
+
+    result = create_slot_inclusion_joined_df({}, sequencers).sort(by="hash")
+
+    assert result.columns == [
+        "slot", "slot_time", "hash", "blob_hashes_length", "fill_percentage", "submission_count", "slot_inclusion_rate",
+        "sequencer_names", "meta_network_name", "block_number", "extra_data", "builder_label", "base_tx_fee_eth",
+        "priority_tx_fee_eth", "base_fee_per_gas", "priority_fee_gas", "total_tx_fee_eth", "priority_fee_bid_percent_premium",
+    ]
+    # `0x03` is sent by an unlabeled address and has no gas data, so its joined columns stay null
+    assert result.select(
+        "hash", "sequencer_names", "slot", "blob_hashes_length", "block_number", "builder_label",
+        "base_tx_fee_eth", "priority_tx_fee_eth", "base_fee_per_gas", "priority_fee_gas", "total_tx_fee_eth",
+        "priority_fee_bid_percent_premium",
+    ).to_dicts() == [
+        {
+            "hash": "0x01", "sequencer_names": "arbitrum", "slot": 1, "blob_hashes_length": 1, "block_number": 10,
+            "builder_label": "rsync_builder", "base_tx_fee_eth": 0.1, "priority_tx_fee_eth": 0.01,
+            "base_fee_per_gas": 5.0, "priority_fee_gas": 1.0, "total_tx_fee_eth": 0.11, "priority_fee_bid_percent_premium": 0.2,
+        },
+        {
+            "hash": "0x02", "sequencer_names": "base", "slot": 2, "blob_hashes_length": 2, "block_number": 11,
+            "builder_label": "vanilla_builder_geth", "base_tx_fee_eth": 0.2, "priority_tx_fee_eth": 0.02,
+            "base_fee_per_gas": 6.0, "priority_fee_gas": 2.0, "total_tx_fee_eth": 0.22, "priority_fee_bid_percent_premium": 0.3,
+        },
+        {
+            "hash": "0x03", "sequencer_names": None, "slot": 3, "blob_hashes_length": 3, "block_number": None,
+            "builder_label": None, "base_tx_fee_eth": None, "priority_tx_fee_eth": None,
+            "base_fee_per_gas": None, "priority_fee_gas": None, "total_tx_fee_eth": None, "priority_fee_bid_percent_premium": None,
+        },
+    ]
@@ -0,0 +1,281 @@
+import json
+import os
+import subprocess
+import sys
+import types
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from eip4844_blob_data.snapshot import (
+    LATEST_POINTER,
+    MANIFEST_FILE,
+    SNAPSHOT_FRAMES,
+    SNAPSHOT_SCHEMA_VERSION,
+    create_snapshot_frames,
+    load_snapshot,
+    main,
+    prune_snapshots,
+    write_snapshot,
+)
+from eip4844_blob_data.sequencers import sequencers_l2
+
+SEQUENCER_NAMES: list[str] = ["base", "arbitrum"]
+
+
+def make_frames(offset: int = 0) -> dict[str, pl.DataFrame]:
+    return {
+        "slot_inclusion_df": pl.DataFrame({
+            "slot": [1 + offset, 2 + offset],
+            "slot_time": [datetime(2024, 6, 1, 0, 0, 12), datetime(2024, 6, 1, 0, 0, 24)],
+            "sequencer_names": SEQUENCER_NAMES,
+            "slot_inclusion_rate": [1.0, 3.0],
+        }),
+        "slot_gas_groupby_df": pl.DataFrame({
+            "slot_inclusion_rate": [1.0, 3.0],
+            "sequencer_names": SEQUENCER_NAMES,
+            "priority_fee_bid_percent_premium": [0.1 + offset, 0.2],
+        }),
+        "block_agg_df": pl.DataFrame({
+            "slot_time": [datetime(2024, 6, 1, 0, 0, 12)],
+            "block_number": [100 + offset],
+            "total_tx_fees_per_block_eth": [0.5],
+        }),
+        "sequencer_macro_blob_table": pl.DataFrame({
+            "rollup": SEQUENCER_NAMES,
+            "tx_count": [1 + offset, 1],
+        }),
+    }
+
+
+def make_cached_data(num_blobs: int = 60) -> dict[str, pl.DataFrame]:
+    """
+    Synthetic `Preprocessor.cached_data`. Every blob is included two slots after it is first seen; the first 49
+    are dropped by the 50 blob rolling average in `create_slot_inclusion_df`.
+    """
+    start = datetime(2024, 6, 1)
+    addresses = sequencers_l2["sequencer_addresses"][:2]
+    versioned_hashes = [f"0x01{i:062x}" for i in range(num_blobs)]
+    tx_hashes = [f"0x{i:064x}" for i in range(num_blobs)]
+    slot_times = [start + timedelta(seconds=12 * (i + 2)) for i in range(num_blobs)]
+    mempool_df = pl.DataFrame({
+        "blob_hashes": [[h] for h in versioned_hashes],
+        "nonce": list(range(num_blobs)),
+        "event_date_time": [start + timedelta(seconds=12 * i) for i in range(num_blobs)],
+        "blob_hashes_length": [1] * num_blobs,
+        "blob_sidecars_size": [131072] * num_blobs,
+        "fill_percentage": [90.0] * num_blobs,
+        "blob_gas": [131072] * num_blobs,
+        "blob_gas_fee_cap": [10**9] * num_blobs,
+        "gas_price": [10**10] * num_blobs,
+        "gas_tip_cap": [10**9] * num_blobs,
+        "gas_fee_cap": [2 * 10**10] * num_blobs,
+        "hash": tx_hashes,
+        "from": [addresses[i % 2] for i in range(num_blobs)],
+        "to": ["0xff00000000000000000000000000000000000010"] * num_blobs,
+    }).with_columns(pl.col("event_date_time").cast(pl.Datetime("ms")))
+    canonical_beacon_blob_sidecar_df = pl.DataFrame({
+        "versioned_hash": versioned_hashes,
+        "blob_index": [0] * num_blobs,
+        "slot": list(range(100, 100 + num_blobs)),
+        "slot_start_date_time": slot_times,
+        "block_root": [f"0x{i:064x}" for i in range(num_blobs)],
+        "kzg_commitment": [f"0x{i:096x}" for i in range(num_blobs)],
+        "meta_network_name": ["mainnet"] * num_blobs,
+        "blob_size": [131072] * num_blobs,
+        "blob_empty_size": [0] * num_blobs,
+    }).with_columns(pl.col("slot_start_date_time").cast(pl.Datetime("ms")))
+    txs = pl.DataFrame({
+        "hash": tx_hashes,
+        "block_number": list(range(1000, 1000 + num_blobs)),
+        "base_fee_per_gas": [10**10] * num_blobs,
+        "gas_used": [21000] * num_blobs,
+        "effective_gas_price": [11 * 10**9] * num_blobs,
+        "max_priority_fee_per_gas": [10**9] * num_blobs,
+        "extra_data": ["0x7273796e632d6275696c6465722e78797a"] * num_blobs,
+    })
+    return {"mempool_df": mempool_df, "canonical_beacon_blob_sidecar_df": canonical_beacon_blob_sidecar_df, "txs": txs}
+
+
+def read_latest(output_dir) -> str:
+    with open(os.path.join(output_dir, LATEST_POINTER)) as f:
+        return f.read()
+
+
+def test_write_and_load_snapshot(tmp_path):
+    frames = make_frames()
+    snapshot_dir = write_snapshot(frames, str(tmp_path), SEQUENCER_NAMES, 7)
+
+    loaded_frames, manifest = load_snapshot(str(tmp_path))
+
+    for name in SNAPSHOT_FRAMES:
+        assert_frame_equal(loaded_frames[name], frames[name])
+
+    assert manifest["schema_version"] == SNAPSHOT_SCHEMA_VERSION
+    assert manifest["version"] == os.path.basename(snapshot_dir)
+    assert manifest["num_days"] == 7
+    assert manifest["sequencer_names"] == sorted(SEQUENCER_NAMES)
+    assert manifest["frames"] == {name: frames[name].height for name in SNAPSHOT_FRAMES}
+    assert read_latest(tmp_path) == manifest["version"]
+    # only the snapshot directory and the pointer are left behind, no temporary files
+    assert sorted(os.listdir(tmp_path)) == sorted([LATEST_POINTER, manifest["version"]])
+
+
+def test_latest_pointer_is_swapped(tmp_path):
+    first_dir = write_snapshot(make_frames(), str(tmp_path), SEQUENCER_NAMES, 7)
+    second_frames = make_frames(offset=10)
+    second_dir = write_snapshot(second_frames, str(tmp_path), SEQUENCER_NAMES, 7)
+
+    assert first_dir != second_dir
+    assert read_latest(tmp_path) == os.path.basename(second_dir)
+
+    loaded_frames, _ = load_snapshot(str(tmp_path))
+    assert_frame_equal(loaded_frames["block_agg_df"], second_frames["block_agg_df"])
+
+    # older versions can still be loaded explicitly
+    first_frames, _ = load_snapshot(str(tmp_path), os.path.basename(first_dir))
+    assert_frame_equal(first_frames["block_agg_df"], make_frames()["block_agg_df"])
+
+
+def test_load_snapshot_schema_version_mismatch(tmp_path):
+    snapshot_dir = write_snapshot(make_frames(), str(tmp_path), SEQUENCER_NAMES, 7)
+
+    manifest_path = os.path.join(snapshot_dir, MANIFEST_FILE)
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    manifest["schema_version"] = SNAPSHOT_SCHEMA_VERSION + 1
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+    with pytest.raises(ValueError, match="schema version"):
+        load_snapshot(str(tmp_path))
+
+
+def test_load_snapshot_missing_latest(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_snapshot(str(tmp_path))
+
+
+def test_prune_snapshots(tmp_path):
+    versions = [
+        os.path.basename(write_snapshot(make_frames(), str(tmp_path), SEQUENCER_NAMES, 7)) for _ in range(4)
+    ]
+
+    deleted = prune_snapshots(str(tmp_path), keep=2)
+
+    assert deleted == versions[:2]
+    assert sorted(os.listdir(tmp_path)) == sorted([LATEST_POINTER, *versions[2:]])
+
+
+def test_prune_snapshots_keeps_latest(tmp_path):
+    versions = [
+        os.path.basename(write_snapshot(make_frames(), str(tmp_path), SEQUENCER_NAMES, 7)) for _ in range(3)
+    ]
+    # point `LATEST` back at the oldest version, e.g. after a manual rollback
+    with open(os.path.join(tmp_path, LATEST_POINTER), "w") as f:
+        f.write(versions[0])
+
+    deleted = prune_snapshots(str(tmp_path), keep=1)
+
+    assert deleted == versions[1:2]
+    assert sorted(os.listdir(tmp_path)) == sorted([LATEST_POINTER, versions[0], versions[2]])
+    load_snapshot(str(tmp_path))
+
+
+def test_write_snapshot_refuses_empty_slot_inclusion_df(tmp_path):
+    good_dir = write_snapshot(make_frames(), str(tmp_path), SEQUENCER_NAMES, 7)
+    frames = make_frames()
+    frames["slot_inclusion_df"] = frames["slot_inclusion_df"].clear()
+
+    with pytest.raises(ValueError, match="empty"):
+        write_snapshot(frames, str(tmp_path), SEQUENCER_NAMES, 7)
+
+    assert read_latest(tmp_path) == os.path.basename(good_dir)
+    assert sorted(os.listdir(tmp_path)) == sorted([LATEST_POINTER, os.path.basename(good_dir)])
+
+
+def test_create_snapshot_frames():
+    frames = create_snapshot_frames(make_cached_data())
+
+    assert sorted(frames) == sorted(SNAPSHOT_FRAMES)
+    assert frames["slot_inclusion_df"].height == 11
+    assert frames["slot_inclusion_df"]["slot_inclusion_rate"].unique().to_list() == [2.0]
+    assert frames["block_agg_df"].height == 11
+    assert frames["slot_gas_groupby_df"].height == 2
+    assert sorted(frames["sequencer_macro_blob_table"]["rollup"].to_list()) == ["arbitrum", "base"]
+    assert frames["sequencer_macro_blob_table"]["tx_count"].sum() == 11
+
+
+@pytest.fixture
+def fake_preprocessor(monkeypatch):
+    """
+    Replaces `ethpandaops_python.preprocessor.Preprocessor` so `main` runs without database access.
+    """
+    class Preprocessor:
+        cached_data_blobs: int = 60
+        calls: list[dict] = []
+
+        def __init__(self, **kwargs):
+            Preprocessor.calls.append(kwargs)
+            self.cached_data = make_cached_data(Preprocessor.cached_data_blobs)
+
+    package = types.ModuleType("ethpandaops_python")
+    module = types.ModuleType("ethpandaops_python.preprocessor")
+    module.Preprocessor = Preprocessor
+    package.preprocessor = module
+    monkeypatch.setitem(sys.modules, "ethpandaops_python", package)
+    monkeypatch.setitem(sys.modules, "ethpandaops_python.preprocessor", module)
+
+    return Preprocessor
+
+
+def test_main_writes_snapshot(tmp_path, fake_preprocessor):
+    main(["--output-dir", str(tmp_path), "--keep", "1"])
+    main(["--output-dir", str(tmp_path), "--keep", "1", "--days", "3"])
+
+    assert [call["period"] for call in fake_preprocessor.calls] == [7, 3]
+    assert all(call["network"] == "mainnet" for call in fake_preprocessor.calls)
+    assert all(call["blob_producer"] == sequencers_l2 for call in fake_preprocessor.calls)
+
+    # `--keep 1` pruned the first run
+    version = read_latest(tmp_path)
+    assert sorted(os.listdir(tmp_path)) == sorted([LATEST_POINTER, version])
+    assert sorted(os.listdir(tmp_path / version)) == sorted(
+        [MANIFEST_FILE, *[f"{name}.parquet" for name in SNAPSHOT_FRAMES]])
+
+    frames, manifest = load_snapshot(str(tmp_path))
+    assert manifest["num_days"] == 3
+    assert manifest["sequencer_names"] == sorted(sequencers_l2["sequencer_names"])
+    assert manifest["frames"] == {name: frames[name].height for name in SNAPSHOT_FRAMES}
+    assert frames["slot_inclusion_df"].height == 11
+
+
+def test_main_keeps_previous_snapshot_when_no_data(tmp_path, fake_preprocessor):
+    main(["--output-dir", str(tmp_path), "--keep", "1"])
+    version = read_latest(tmp_path)
+
+    # fewer blobs than the rolling average window leaves `slot_inclusion_df` empty
+    fake_preprocessor.cached_data_blobs = 10
+    with pytest.raises(ValueError, match="empty"):
+        main(["--output-dir", str(tmp_path), "--keep", "1"])
+
+    assert read_latest(tmp_path) == version
+    assert sorted(os.listdir(tmp_path)) == sorted([LATEST_POINTER, version])
+
+
+def test_entry_points_do_not_import_heavy_modules():
+    heavy_modules = ["panel", "holoviews", "hvplot", "ethpandaops_python"]
+    code = (
+        "import sys\n"
+        "import eip4844_blob_data.app\n"
+        "import eip4844_blob_data.snapshot\n"
+        f"print(','.join(m for m in {heavy_modules!r} if m in sys.modules))\n"
+    )
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src_dir, os.environ.get("PYTHONPATH")]))}
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+
+    assert result.stdout.strip() == ""